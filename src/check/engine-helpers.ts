@@ -22,55 +22,49 @@ export function hasDdash(call: CallExprNode): boolean {
   return call.args.some((w) => wordToLit(w) === "--");
 }
 
-/** True if the AST contains any write redirect matching pathPattern. */
-export function hasWriteRedirect(ast: ShellFile, pathPattern?: RegExp): boolean {
-  let found = false;
+/**
+ * Literal targets of every write redirect in the AST, in walk order, collected in
+ * one pass so redirect rules and path rules can share it. Targets that are not
+ * plain literals (e.g. `> "$f"`) are kept as null.
+ */
+export function collectWriteRedirectTargets(ast: ShellFile): Array<string | null> {
+  const targets: Array<string | null> = [];
   walk(ast, {
     Stmt(node: Stmt) {
-      if (found) return;
       for (const redir of node.redirs) {
-        if (!WRITE_OPS.has(redir.op)) continue;
-        if (pathPattern === undefined) {
-          found = true;
-          return;
-        }
-        const target = wordToLit(redir.word);
-        if (target !== null && pathPattern.test(target)) {
-          found = true;
-          return;
-        }
+        if (WRITE_OPS.has(redir.op)) targets.push(wordToLit(redir.word));
       }
     },
   });
-  return found;
+  return targets;
+}
+
+/** True if any write redirect target matches pathPattern (or any exists, if none). */
+export function hasWriteRedirect(
+  targets: ReadonlyArray<string | null>,
+  pathPattern?: RegExp
+): boolean {
+  if (pathPattern === undefined) return targets.length > 0;
+  return targets.some((target) => target !== null && pathPattern.test(target));
 }
 
 /** Checks redirect targets against path rules — catches `cmd > .env` patterns. */
 export function checkRedirectsAgainstPathRules(
-  ast: ShellFile,
+  targets: ReadonlyArray<string | null>,
   pathRules: readonly PathRule[]
 ): CheckResult | null {
-  let result: CheckResult | null = null;
-  walk(ast, {
-    Stmt(node: Stmt) {
-      if (result !== null) return;
-      for (const redir of node.redirs) {
-        if (!WRITE_OPS.has(redir.op)) continue;
-        const target = wordToLit(redir.word);
-        if (target === null) continue;
-        for (const rule of pathRules) {
-          if (
-            (rule.event === "both" || rule.event === "write") &&
-            rule.pattern.test(target)
-          ) {
-            result = { decision: rule.decision, reason: rule.reason };
-            return;
-          }
-        }
+  for (const target of targets) {
+    if (target === null) continue;
+    for (const rule of pathRules) {
+      if (
+        (rule.event === "both" || rule.event === "write") &&
+        rule.pattern.test(target)
+      ) {
+        return { decision: rule.decision, reason: rule.reason };
       }
-    },
-  });
-  return result;
+    }
+  }
+  return null;
 }
 
 /** Walk BinaryCmd pipe nodes to detect actual `from | into` patterns. */
@@ -110,7 +104,7 @@ function stmtToCmd(stmt: Stmt): string | null {
 
 /** Checks tee/cp/mv/sed-i argument destinations against path rules. */
 export function checkWriteArgCommands(
-  calls: CallExprNode[],
+  calls: readonly UnwrappedCall[],
   pathRules: readonly PathRule[],
   evaluatePath: (
     path: string,
@@ -118,9 +112,7 @@ export function checkWriteArgCommands(
     rules: readonly PathRule[]
   ) => CheckResult
 ): CheckResult | null {
-  for (const call of calls) {
-    const unwrapped = unwrapCall(call);
-    if (unwrapped === null) continue;
+  for (const unwrapped of calls) {
     const writePaths: string[] = [];
 
     if (ALL_ARGS_WRITE_CMDS.has(unwrapped.cmd)) {
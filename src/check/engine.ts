@@ -1,22 +1,18 @@
-import type { ShellFile } from "@questi0nm4rk/shell-ast";
+import type { CallExprNode, ShellFile } from "@questi0nm4rk/shell-ast";
 import { findCalls, parse } from "@questi0nm4rk/shell-ast";
+import type { UnwrappedCall } from "@questi0nm4rk/shell-ast/semantic";
 import { unwrapCall } from "@questi0nm4rk/shell-ast/semantic";
 import {
   checkRedirectsAgainstPathRules,
   checkWriteArgCommands,
+  collectWriteRedirectTargets,
   extractInlineScript,
   findPipeViolations,
   hasDdash,
   hasWriteRedirect,
 } from "@/check/engine-helpers";
 import { expandFlags, hasFlag } from "@/check/flag-aliases";
-import type {
-  CheckResult,
-  CommandRule,
-  PathRule,
-  RuleSet,
-  ToolEvent,
-} from "@/check/types";
+import type { CheckResult, PathRule, RuleSet, ToolEvent } from "@/check/types";
 
 const INLINE_SHELL_CMDS = new Set(["bash", "sh", "dash", "zsh", "ksh", "eval", "exec"]);
 const MAX_RECURSE_DEPTH = 5;
@@ -26,17 +22,17 @@ export async function evaluate(
   ruleset: RuleSet
 ): Promise<CheckResult> {
   if (event.type === "bash") {
-    return evaluateCommand(event.command, ruleset.commandRules, ruleset.pathRules, 0);
+    return evaluateCommand(event.command, ruleset, 0);
   }
   return evaluatePath(event.path, event.type, ruleset.pathRules);
 }
 
 async function evaluateCommand(
   command: string,
-  rules: readonly CommandRule[],
-  pathRules: readonly PathRule[],
+  ruleset: RuleSet,
   depth: number
 ): Promise<CheckResult> {
+  const { commandRules: rules, pathRules } = ruleset;
   if (depth > MAX_RECURSE_DEPTH)
     return {
       decision: "ask",
@@ -49,52 +45,68 @@ async function evaluateCommand(
     return { decision: "allow" };
   }
 
-  for (const rule of rules) {
-    if (rule.kind === "redirect" && hasWriteRedirect(ast, rule.pathPattern)) {
-      return { decision: rule.decision, reason: rule.reason };
+  // Redirect and pipe operators are syntax of the string just parsed: without a
+  // `>` there is no write redirect and without a `|` there is no pipe node, so
+  // those AST walks can be skipped. Quoted or escaped text never forms operators,
+  // and inline scripts are re-checked against their own text on recursion.
+  if (command.includes(">")) {
+    const redirectTargets = collectWriteRedirectTargets(ast);
+    for (const rule of rules) {
+      if (
+        rule.kind === "redirect" &&
+        hasWriteRedirect(redirectTargets, rule.pathPattern)
+      ) {
+        return { decision: rule.decision, reason: rule.reason };
+      }
     }
-  }
 
-  const redirectResult = checkRedirectsAgainstPathRules(ast, pathRules);
-  if (redirectResult !== null) return redirectResult;
+    const redirectResult = checkRedirectsAgainstPathRules(redirectTargets, pathRules);
+    if (redirectResult !== null) return redirectResult;
+  }
 
   // Pipe detection via AST BinaryCmd nodes — avoids false positives from &&/|| adjacency
-  const pipeResult = findPipeViolations(ast, rules);
-  if (pipeResult !== null) return pipeResult;
+  if (command.includes("|")) {
+    const pipeResult = findPipeViolations(ast, rules);
+    if (pipeResult !== null) return pipeResult;
+  }
 
-  const calls = findCalls(ast);
+  // Unwrap each call once; the write-destination check and the rule loop below
+  // both work on the unwrapped form.
+  const calls: Array<{ call: CallExprNode; unwrapped: UnwrappedCall }> = [];
+  for (const call of findCalls(ast)) {
+    const unwrapped = unwrapCall(call);
+    if (unwrapped !== null) calls.push({ call, unwrapped });
+  }
 
   // Check tee/cp/mv/sed-i argument destinations against path rules
-  const writeArgResult = checkWriteArgCommands(calls, pathRules, evaluatePath);
+  const writeArgResult = checkWriteArgCommands(
+    calls.map((c) => c.unwrapped),
+    pathRules,
+    evaluatePath
+  );
   if (writeArgResult !== null) return writeArgResult;
 
-  for (let i = 0; i < calls.length; i++) {
-    const call = calls[i];
-    if (call === undefined) continue;
-    const unwrapped = unwrapCall(call);
-    if (unwrapped === null) continue;
-    const expanded = expandFlags(unwrapped.flags);
-
-    for (const rule of rules) {
-      if (rule.kind === "recurse" && INLINE_SHELL_CMDS.has(unwrapped.cmd)) {
-        const inline = extractInlineScript(unwrapped);
-        if (inline !== null) {
-          const result = await evaluateCommand(inline, rules, pathRules, depth + 1);
-          if (result.decision !== "allow") return result;
-        }
+  for (const { call, unwrapped } of calls) {
+    if (ruleset.recurseInline && INLINE_SHELL_CMDS.has(unwrapped.cmd)) {
+      const inline = extractInlineScript(unwrapped);
+      if (inline !== null) {
+        const result = await evaluateCommand(inline, ruleset, depth + 1);
+        if (result.decision !== "allow") return result;
       }
+    }
+
+    const callRules = ruleset.callRulesByCmd.get(unwrapped.cmd);
+    if (callRules === undefined) continue;
+    const expanded = expandFlags(unwrapped.flags);
 
-      if (rule.kind === "call" && rule.cmd === unwrapped.cmd) {
-        if (rule.sub !== undefined && unwrapped.args[0] !== rule.sub) continue;
-        const allFlagsPresent = (rule.flags ?? []).every((f) => hasFlag(expanded, f));
-        const noFlagPresent = (rule.noFlags ?? []).every((f) => !hasFlag(expanded, f));
-        const allArgsPresent = (rule.args ?? []).every((a) =>
-          unwrapped.args.includes(a)
-        );
-        const ddashOk = rule.hasDdash === true ? hasDdash(call) : true;
-        if (allFlagsPresent && noFlagPresent && allArgsPresent && ddashOk) {
-          return { decision: rule.decision, reason: rule.reason };
-        }
+    for (const rule of callRules) {
+      if (rule.sub !== undefined && unwrapped.args[0] !== rule.sub) continue;
+      const allFlagsPresent = (rule.flags ?? []).every((f) => hasFlag(expanded, f));
+      const noFlagPresent = (rule.noFlags ?? []).every((f) => !hasFlag(expanded, f));
+      const allArgsPresent = (rule.args ?? []).every((a) => unwrapped.args.includes(a));
+      const ddashOk = rule.hasDdash === true ? hasDdash(call) : true;
+      if (allFlagsPresent && noFlagPresent && allArgsPresent && ddashOk) {
+        return { decision: rule.decision, reason: rule.reason };
       }
     }
   }
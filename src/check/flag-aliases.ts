@@ -41,40 +41,48 @@ const FLAG_EXPANSIONS: ReadonlyMap<string, readonly string[]> = new Map([
   ["-D", ["--delete", "--force"]],
 ]);
 
+/**
+ * Full expansion of every known flag — the flag itself, its compound
+ * expansion, and every alias reachable from either — resolved once at import
+ * so expandFlags is a single map lookup per input flag.
+ */
+const FLAG_CLOSURES: ReadonlyMap<string, readonly string[]> = (() => {
+  const map = new Map<string, string[]>();
+  const known = new Set([...FLAG_ALIASES.keys(), ...FLAG_EXPANSIONS.keys()]);
+  for (const flag of known) {
+    const closure = new Set<string>([flag, ...(FLAG_EXPANSIONS.get(flag) ?? [])]);
+    const pending = [...closure];
+    for (let f = pending.pop(); f !== undefined; f = pending.pop()) {
+      for (const alias of FLAG_ALIASES.get(f) ?? []) {
+        if (!closure.has(alias)) {
+          closure.add(alias);
+          pending.push(alias);
+        }
+      }
+    }
+    map.set(flag, [...closure]);
+  }
+  return map;
+})();
+
 /**
  * Expand a list of flags by applying FLAG_EXPANSIONS and FLAG_ALIASES.
  * The result contains every original flag (including compound flags like `-D`)
  * plus their expansions and all alias equivalents, with full transitivity
- * through the alias graph.
+ * through the alias graph (precomputed in FLAG_CLOSURES).
  */
 export function expandFlags(flags: readonly string[]): string[] {
   const result = new Set<string>();
-
   for (const flag of flags) {
-    result.add(flag);
-
-    const expansion = FLAG_EXPANSIONS.get(flag);
-    if (expansion !== undefined) {
-      for (const f of expansion) {
-        result.add(f);
-      }
+    const closure = FLAG_CLOSURES.get(flag);
+    if (closure === undefined) {
+      result.add(flag);
+      continue;
     }
-  }
-
-  // Add aliases — iterate until no new entries
-  let prevSize = 0;
-  while (result.size !== prevSize) {
-    prevSize = result.size;
-    for (const flag of [...result]) {
-      const aliases = FLAG_ALIASES.get(flag);
-      if (aliases !== undefined) {
-        for (const alias of aliases) {
-          result.add(alias);
-        }
-      }
+    for (const f of closure) {
+      result.add(f);
     }
   }
-
   return [...result];
 }
 
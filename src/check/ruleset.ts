@@ -5,11 +5,29 @@ import { recurseRule } from "@/check/builder-cmd";
 import { protectRead, protectWrite } from "@/check/builder-path";
 import { ALL_RULE_GROUPS, collectCommandRules } from "@/check/rules/groups";
 import { DEFAULT_MANAGED_FILES, DEFAULT_PATH_RULES } from "@/check/rules/paths";
-import type { CommandRule, HooksConfig, RuleSet } from "@/check/types";
+import type {
+  CallRule,
+  CommandRule,
+  HooksConfig,
+  PathRule,
+  RuleSet,
+} from "@/check/types";
 import { ProjectConfigSchema } from "@/config/schema";
 import { PROJECT_CONFIG_PATH } from "@/models/paths";
 import { isEnoent } from "@/utils/errors";
 
+function managedFileRule(f: string): PathRule {
+  return protectWrite(
+    new RegExp(`(?:^|/)${escapeRegExp(f)}$`), // nosemgrep: detect-non-literal-regexp // ai-guardrails-allow: semgrep/detect-non-literal-regexp "input fully escaped via escapeRegExp; no ReDoS risk"
+    `Writing to managed file: ${f}`
+  );
+}
+
+// Config-independent rules are compiled once at import; only the
+// project-specific managed/protected entries are built per buildRuleSet call.
+const DEFAULT_MANAGED_FILE_RULES: readonly PathRule[] =
+  DEFAULT_MANAGED_FILES.map(managedFileRule);
+
 export function buildRuleSet(config: HooksConfig): RuleSet {
   const disabled = new Set(config.disabledGroups ?? []);
   const activeGroups = ALL_RULE_GROUPS.filter((g) => !disabled.has(g.id));
@@ -20,18 +38,8 @@ export function buildRuleSet(config: HooksConfig): RuleSet {
   ];
 
   const extraPathRules = [
-    ...DEFAULT_MANAGED_FILES.map((f) =>
-      protectWrite(
-        new RegExp(`(?:^|/)${escapeRegExp(f)}$`), // nosemgrep: detect-non-literal-regexp // ai-guardrails-allow: semgrep/detect-non-literal-regexp "input fully escaped via escapeRegExp; no ReDoS risk"
-        `Writing to managed file: ${f}`
-      )
-    ),
-    ...(config.managedFiles ?? []).map((f) =>
-      protectWrite(
-        new RegExp(`(?:^|/)${escapeRegExp(f)}$`), // nosemgrep: detect-non-literal-regexp // ai-guardrails-allow: semgrep/detect-non-literal-regexp "input fully escaped via escapeRegExp; no ReDoS risk"
-        `Writing to managed file: ${f}`
-      )
-    ),
+    ...DEFAULT_MANAGED_FILE_RULES,
+    ...(config.managedFiles ?? []).map(managedFileRule),
     ...(config.managedPaths ?? []).map((p) =>
       protectWrite(
         new RegExp(escapeRegExp(p)), // nosemgrep: detect-non-literal-regexp // ai-guardrails-allow: semgrep/detect-non-literal-regexp "input fully escaped via escapeRegExp; no ReDoS risk"
@@ -49,9 +57,23 @@ export function buildRuleSet(config: HooksConfig): RuleSet {
   return {
     commandRules,
     pathRules: [...DEFAULT_PATH_RULES, ...extraPathRules],
+    callRulesByCmd: indexCallRules(commandRules),
+    recurseInline: commandRules.some((rule) => rule.kind === "recurse"),
   };
 }
 
+/** Group call rules by command name so a call only visits rules for its `cmd`. */
+function indexCallRules(rules: readonly CommandRule[]): Map<string, CallRule[]> {
+  const byCmd = new Map<string, CallRule[]>();
+  for (const rule of rules) {
+    if (rule.kind !== "call") continue;
+    const forCmd = byCmd.get(rule.cmd);
+    if (forCmd === undefined) byCmd.set(rule.cmd, [rule]);
+    else forCmd.push(rule);
+  }
+  return byCmd;
+}
+
 function escapeRegExp(s: string): string {
   return s.replace(/[.*+?^${}()|[\]\\]/g, "\\$&");
 }
@@ -61,6 +61,10 @@ export interface RuleGroup {
 export interface RuleSet {
   readonly commandRules: readonly CommandRule[];
   readonly pathRules: readonly PathRule[];
+  /** Call rules from `commandRules` grouped by `cmd`, in ruleset order. */
+  readonly callRulesByCmd: ReadonlyMap<string, readonly CallRule[]>;
+  /** Re-check inline scripts (`bash -c`, `eval`) before matching call rules. */
+  readonly recurseInline: boolean;
 }
 
 export interface HooksConfig {
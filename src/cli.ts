@@ -1,17 +1,10 @@
 import { Command, Option } from "@commander-js/extra-typings";
-import { runAllow } from "@/commands/allow";
-import { runCheck } from "@/commands/check";
-import { getCompletionScript } from "@/commands/completion";
-import { runGenerate } from "@/commands/generate";
-import { runHook } from "@/commands/hook";
-import { runInit } from "@/commands/init";
-import { runInstall } from "@/commands/install";
-import { runQuery } from "@/commands/query";
-import { runReport } from "@/commands/report";
-import { runSnapshot } from "@/commands/snapshot";
-import { runStatus } from "@/commands/status";
 import pkg from "../package.json";
 
+// Command modules are imported inside each action so a single invocation only
+// evaluates the module graph of the subcommand it runs. This matters most for
+// `hook`, which agents and git hooks spawn on every tool call / commit.
+
 const program = new Command()
   .name("ai-guardrails")
   .description("Pedantic code quality enforcement for AI-maintained repositories")
@@ -38,6 +31,7 @@ program
   .description("One-time machine setup")
   .option("--upgrade", "Overwrite existing machine config")
   .action(async (opts) => {
+    const { runInstall } = await import("@/commands/install");
     await runInstall(getProjectDir(), { ...opts });
   });
 
@@ -81,6 +75,7 @@ program
       .default("merge")
   )
   .action(async (opts) => {
+    const { runInit } = await import("@/commands/init");
     await runInit(getProjectDir(), { ...opts });
   });
 
@@ -92,6 +87,7 @@ program
   .description("Regenerate all managed config files")
   .option("--check", "Verify files are up-to-date (CI mode)")
   .action(async (opts) => {
+    const { runGenerate } = await import("@/commands/generate");
     await runGenerate(getProjectDir(), { ...opts });
   });
 
@@ -105,6 +101,7 @@ program
   .option("--format <format>", "Output format: text | sarif", "text")
   .option("--strict", "Ignore baseline — all issues are new")
   .action(async (opts) => {
+    const { runCheck } = await import("@/commands/check");
     await runCheck(getProjectDir(), { ...opts });
   });
 
@@ -116,6 +113,7 @@ program
   .description("Capture current lint state as baseline")
   .option("--baseline <path>", "Custom output path")
   .action(async (opts) => {
+    const { runSnapshot } = await import("@/commands/snapshot");
     await runSnapshot(getProjectDir(), { ...opts });
   });
 
@@ -126,6 +124,7 @@ program
   .command("status")
   .description("Project health dashboard")
   .action(async () => {
+    const { runStatus } = await import("@/commands/status");
     await runStatus(getProjectDir(), {});
   });
 
@@ -137,6 +136,7 @@ program
   .description("Show recent check run history")
   .option("--last <n>", "Number of runs to show", (v) => Number.parseInt(v, 10), 10)
   .action(async (opts) => {
+    const { runReport } = await import("@/commands/report");
     await runReport(getProjectDir(), { last: opts.last });
   });
 
@@ -152,6 +152,7 @@ program
   )
   .argument("[args...]", "Additional arguments (e.g. staged file paths)")
   .action(async (hookName, args) => {
+    const { runHook } = await import("@/commands/hook");
     await runHook(hookName, args);
   });
 
@@ -165,6 +166,7 @@ program
   .argument("<glob>", "File glob to apply the rule to (e.g. src/**/*.ts)")
   .argument("<reason>", "Human-readable reason for allowing the rule")
   .action(async (rule, glob, reason) => {
+    const { runAllow } = await import("@/commands/allow");
     await runAllow(getProjectDir(), rule, glob, reason);
   });
 
@@ -176,6 +178,7 @@ program
   .description("Show all files where a rule is allowed (config + inline comments)")
   .argument("<rule>", "Rule in linter/RULE_CODE format (e.g. biome/noConsole)")
   .action(async (rule) => {
+    const { runQuery } = await import("@/commands/query");
     await runQuery(getProjectDir(), rule);
   });
 
@@ -186,7 +189,8 @@ program
   .command("completion")
   .description("Generate shell completion script")
   .argument("<shell>", "Shell: bash | zsh | fish")
-  .action((shell) => {
+  .action(async (shell) => {
+    const { getCompletionScript } = await import("@/commands/completion");
     try {
       process.stdout.write(getCompletionScript(shell));
     } catch (e: unknown) {
@@ -4,6 +4,8 @@ import type { Console } from "@/infra/console";
 import type { FileManager } from "@/infra/file-manager";
 import { PROJECT_CONFIG_PATH } from "@/models/paths";
 
+const RULE_FORMAT_RE = /^[\w-]+\/[\w\-.]+$/;
+
 /**
  * Escape a value for use inside a TOML basic string (double-quoted).
  * TOML basic strings only require `\` and `"` to be escaped.
@@ -52,8 +54,7 @@ export async function runAllow(
   glob: string,
   reason: string
 ): Promise<void> {
-  const ruleRe = /^[\w-]+\/[\w\-.]+$/;
-  if (!ruleRe.test(rule)) {
+  if (!RULE_FORMAT_RE.test(rule)) {
     process.stderr.write(
       `Error: rule must be in the format "linter/RULE_CODE" (e.g. biome/noConsole)\n`
     );
@@ -1,9 +1,3 @@
-import { runDangerousCmd } from "@/hooks/dangerous-cmd";
-import { runFormatStage } from "@/hooks/format-stage";
-import { runProtectConfigs } from "@/hooks/protect-configs";
-import { runProtectReads } from "@/hooks/protect-reads";
-import { runSuppressComments } from "@/hooks/suppress-comments";
-
 const HOOK_NAMES = [
   "dangerous-cmd",
   "protect-configs",
@@ -12,18 +6,30 @@ const HOOK_NAMES = [
   "format-stage",
 ];
 
+// Each hook module is imported only when dispatched: agent hooks don't pay for
+// the git-hook formatters, and git hooks never load the shell parser.
 export async function runHook(hookName: string, args: string[]): Promise<never> {
   switch (hookName) {
-    case "dangerous-cmd":
+    case "dangerous-cmd": {
+      const { runDangerousCmd } = await import("@/hooks/dangerous-cmd");
       return runDangerousCmd();
-    case "protect-configs":
+    }
+    case "protect-configs": {
+      const { runProtectConfigs } = await import("@/hooks/protect-configs");
       return runProtectConfigs();
-    case "protect-reads":
+    }
+    case "protect-reads": {
+      const { runProtectReads } = await import("@/hooks/protect-reads");
       return runProtectReads();
-    case "suppress-comments":
+    }
+    case "suppress-comments": {
+      const { runSuppressComments } = await import("@/hooks/suppress-comments");
       return runSuppressComments(args);
-    case "format-stage":
+    }
+    case "format-stage": {
+      const { runFormatStage } = await import("@/hooks/format-stage");
       return runFormatStage();
+    }
     default: {
       process.stderr.write(
         `Unknown hook: ${hookName}\nAvailable hooks: ${HOOK_NAMES.join(", ")}\n`
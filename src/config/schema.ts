@@ -1,4 +1,4 @@
-import { minimatch } from "minimatch";
+import { Minimatch } from "minimatch";
 import { z } from "zod";
 
 import type { NoConsoleLevel } from "@/utils/detect-project-type";
@@ -123,6 +123,19 @@ export function buildResolvedConfig(
 
   const ignorePaths = project.ignore_paths;
 
+  // isAllowed runs once per lint issue: group allow globs by rule and compile
+  // them here so a lookup is a map hit plus pre-parsed glob matches.
+  const allowMatchers = new Map<string, Minimatch[]>();
+  for (const entry of allow) {
+    const matcher = new Minimatch(entry.glob);
+    const existing = allowMatchers.get(entry.rule);
+    if (existing === undefined) {
+      allowMatchers.set(entry.rule, [matcher]);
+    } else {
+      existing.push(matcher);
+    }
+  }
+
   return {
     profile,
     ...(project.min_version !== undefined && { minVersion: project.min_version }),
@@ -135,9 +148,8 @@ export function buildResolvedConfig(
     noConsoleLevel: "warn" as const,
     isAllowed(rule: string, filePath: string): boolean {
       if (ignoredRules.has(rule)) return true;
-      return allow.some(
-        (entry) => entry.rule === rule && minimatch(filePath, entry.glob)
-      );
+      const matchers = allowMatchers.get(rule);
+      return matchers?.some((m) => m.match(filePath)) ?? false;
     },
   };
 }
@@ -1,4 +1,4 @@
-import { execSync, spawnSync } from "node:child_process";
+import { execSync, spawn } from "node:child_process";
 import { Glob } from "bun";
 
 export const FORMATTERS: Array<{
@@ -13,25 +13,36 @@ export const FORMATTERS: Array<{
   { glob: "**/*.{c,cpp,cc,h,hpp}", cmd: (f) => ["clang-format", "-i", ...f] },
 ];
 
-function tryRun(args: string[]): boolean {
+/**
+ * Run a command with inherited stdio. Resolves false (after logging the cause)
+ * when the command cannot be spawned — e.g. formatter not installed — or exits
+ * non-zero; lefthook reports the hook's exit status.
+ */
+function tryRunAsync(args: string[]): Promise<boolean> {
   const [cmd, ...rest] = args;
-  if (!cmd) return false;
-  const result = spawnSync(cmd, rest, { stdio: "inherit" });
-  if (result.error) {
-    // Formatter not installed or failed to spawn — lefthook will report exit status.
-    // Log the raw error so the cause is visible in hook output.
-    process.stderr.write(
-      `[format-stage] failed to run ${cmd}: ${result.error.message}\n`
-    );
-    return false;
-  }
-  if (result.status !== 0) {
-    process.stderr.write(
-      `[format-stage] ${cmd} exited with status ${String(result.status)}\n`
-    );
-    return false;
-  }
-  return true;
+  if (!cmd) return Promise.resolve(false);
+  return new Promise((resolve) => {
+    let settled = false;
+    const child = spawn(cmd, rest, { stdio: "inherit" });
+    child.on("error", (err) => {
+      if (settled) return;
+      settled = true;
+      process.stderr.write(`[format-stage] failed to run ${cmd}: ${err.message}\n`);
+      resolve(false);
+    });
+    child.on("close", (status) => {
+      if (settled) return;
+      settled = true;
+      if (status !== 0) {
+        process.stderr.write(
+          `[format-stage] ${cmd} exited with status ${String(status)}\n`
+        );
+        resolve(false);
+        return;
+      }
+      resolve(true);
+    });
+  });
 }
 
 export function getStagedFiles(): string[] {
@@ -48,18 +59,25 @@ export async function runFormatStage(): Promise<never> {
   const stagedFiles = getStagedFiles().map((f) => `${cwd}/${f}`);
   if (stagedFiles.length === 0) process.exit(0);
 
-  for (const { glob: pattern, cmd } of FORMATTERS) {
-    const g = new Glob(pattern);
-    const matching = stagedFiles.filter((f) => g.match(f));
-    if (matching.length > 0) {
-      const ok = tryRun(cmd(matching));
-      // Re-stage formatted files so the commit contains the formatted code.
-      // Only re-stage if the formatter succeeded — failed runs leave the staged
-      // version intact, which is safer than staging potentially half-formatted files.
-      if (ok && !tryRun(["git", "add", ...matching])) {
-        process.exit(1);
-      }
-    }
+  // FORMATTERS globs are disjoint, so each formatter touches its own files and
+  // they can all run at once instead of back to back. They share the inherited
+  // stdio, so output from several formatters can interleave.
+  const formatted = await Promise.all(
+    FORMATTERS.map(async ({ glob: pattern, cmd }) => {
+      const g = new Glob(pattern);
+      const matching = stagedFiles.filter((f) => g.match(f));
+      if (matching.length === 0) return [];
+      return (await tryRunAsync(cmd(matching))) ? matching : [];
+    })
+  );
+
+  // Re-stage formatted files so the commit contains the formatted code, in a
+  // single `git add` (concurrent adds would race on the index lock). Only
+  // re-stage files whose formatter succeeded — failed runs leave the staged
+  // version intact, which is safer than staging potentially half-formatted files.
+  const toStage = formatted.flat();
+  if (toStage.length > 0 && !(await tryRunAsync(["git", "add", ...toStage]))) {
+    process.exit(1);
   }
   process.exit(0);
 }
@@ -11,11 +11,9 @@ const hookInputSchema = z.object({
 });
 
 export async function readHookInput(): Promise<HookInput> {
-  const chunks: Buffer[] = [];
-  for await (const chunk of process.stdin) {
-    chunks.push(Buffer.isBuffer(chunk) ? chunk : Buffer.from(String(chunk)));
-  }
-  const raw = Buffer.concat(chunks).toString("utf8");
+  // Bun reads and decodes the whole stream natively — no per-chunk Buffer
+  // collection and concat on every hook invocation.
+  const raw = await Bun.stdin.text();
   let parsed: unknown;
   try {
     parsed = JSON.parse(raw);
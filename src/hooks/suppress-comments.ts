@@ -18,6 +18,15 @@ const SUPPRESSION_PATTERNS: Record<string, RegExp[]> = {
   cpp: [/\/\/ NOLINT/, /#pragma diagnostic ignored/, /#pragma GCC diagnostic ignored/],
 };
 
+// One alternation per language, compiled once. A file whose content matches
+// none of its language's patterns skips the per-line pattern loop entirely.
+const SUPPRESSION_PREFILTERS: Record<string, RegExp> = Object.fromEntries(
+  Object.entries(SUPPRESSION_PATTERNS).map(([lang, patterns]) => [
+    lang,
+    new RegExp(patterns.map((p) => `(?:${p.source})`).join("|")),
+  ])
+);
+
 const EXT_TO_LANG: Record<string, string> = {
   ".py": "python",
   ".ts": "typescript",
@@ -117,28 +126,30 @@ export function scanFile(filePath: string, content: string): Finding[] {
   if (!lang) return [];
 
   const patterns = SUPPRESSION_PATTERNS[lang] ?? [];
+  const prefilter = SUPPRESSION_PREFILTERS[lang];
+  const mayHavePatternHit = prefilter !== undefined && prefilter.test(content);
+  // Comments are slices of the content that start after a comment marker, so a
+  // keyword match inside any comment implies a match against the whole file.
+  const mayHaveGenericHit = GENERIC_SUPPRESSION.test(content);
+  if (!mayHavePatternHit && !mayHaveGenericHit) return [];
+
   const findings: Finding[] = [];
   const lines = content.split("\n");
   const allowedLines = new Set(parseAllowComments(lines).map((c) => c.line));
-  const flaggedLines = new Set<number>();
 
+  // Single pass: a language-specific pattern hit takes precedence; otherwise
+  // fall back to the generic comment-only keyword scanner for the same line.
   for (let i = 0; i < lines.length; i++) {
+    const lineNum = i + 1;
+    if (allowedLines.has(lineNum)) continue;
     const line = lines[i] ?? "";
-    if (allowedLines.has(i + 1)) continue;
-    for (const pattern of patterns) {
-      if (pattern.test(line)) {
-        findings.push({ file: filePath, line: i + 1, pattern: pattern.source });
-        flaggedLines.add(i + 1);
-        break;
-      }
+    const hit = mayHavePatternHit ? patterns.find((p) => p.test(line)) : undefined;
+    if (hit !== undefined) {
+      findings.push({ file: filePath, line: lineNum, pattern: hit.source });
+      continue;
     }
-  }
-
-  // Second pass: generic comment-only keyword scanner
-  for (let i = 0; i < lines.length; i++) {
-    const lineNum = i + 1;
-    if (allowedLines.has(lineNum) || flaggedLines.has(lineNum)) continue;
-    const comment = extractComment(lines[i] ?? "", lang);
+    if (!mayHaveGenericHit) continue;
+    const comment = extractComment(line, lang);
     if (comment !== "" && GENERIC_SUPPRESSION.test(comment)) {
       findings.push({
         file: filePath,
@@ -169,13 +180,12 @@ export async function runSuppressComments(files: string[]): Promise<never> {
   const allFindings = results.flat();
 
   if (allFindings.length > 0) {
-    for (const f of allFindings) {
-      process.stderr.write(
-        `${f.file}:${f.line}: suppression comment detected (${f.pattern})\n`
-      );
-    }
+    // One write for the whole report rather than a syscall per finding.
+    const report = allFindings
+      .map((f) => `${f.file}:${f.line}: suppression comment detected (${f.pattern})\n`)
+      .join("");
     process.stderr.write(
-      'Use "# ai-guardrails-allow: linter/RULE \\"reason\\"" instead of inline suppression.\n'
+      `${report}Use "# ai-guardrails-allow: linter/RULE \\"reason\\"" instead of inline suppression.\n`
     );
     process.exit(1);
   }
@@ -1,6 +1,6 @@
 import { promises as fs } from "node:fs";
 import { Glob } from "bun";
-import { minimatch } from "minimatch";
+import { Minimatch } from "minimatch";
 import { isEnoent } from "@/utils/errors";
 
 export interface FileManager {
@@ -46,12 +46,14 @@ export class RealFileManager implements FileManager {
     ignore?: readonly string[]
   ): Promise<string[]> {
     const g = new Glob(pattern);
+    // Compile ignore globs once and filter as files stream out of the scan,
+    // instead of collecting everything and re-parsing each glob per file.
+    const ignoreMatchers = (ignore ?? []).map((ig) => new Minimatch(ig));
     const results: string[] = [];
     for await (const file of g.scan({ cwd, absolute: false })) {
-      results.push(file);
+      if (!ignoreMatchers.some((m) => m.match(file))) results.push(file);
     }
-    if (ignore === undefined || ignore.length === 0) return results;
-    return results.filter((f) => !ignore.some((ig) => minimatch(f, ig)));
+    return results;
   }
 
   async isSymlink(path: string): Promise<boolean> {
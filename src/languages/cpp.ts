@@ -1,3 +1,4 @@
+import { findProjectFiles } from "@/languages/project-files";
 import type { DetectOptions, LanguagePlugin } from "@/languages/types";
 import { clangTidyRunner } from "@/runners/clang-tidy";
 import type { LinterRunner } from "@/runners/types";
@@ -6,15 +7,11 @@ export const cppPlugin: LanguagePlugin = {
   id: "cpp",
   name: "C/C++",
 
-  async detect({
-    projectDir,
-    fileManager,
-    ignorePaths,
-  }: DetectOptions): Promise<boolean> {
-    if (await fileManager.exists(`${projectDir}/CMakeLists.txt`)) return true;
+  async detect(opts: DetectOptions): Promise<boolean> {
+    if (await opts.fileManager.exists(`${opts.projectDir}/CMakeLists.txt`)) return true;
     const [cppFiles, cFiles] = await Promise.all([
-      fileManager.glob("**/*.cpp", projectDir, ignorePaths),
-      fileManager.glob("**/*.c", projectDir, ignorePaths),
+      findProjectFiles(opts, "**/*.cpp"),
+      findProjectFiles(opts, "**/*.c"),
     ]);
     return cppFiles.length > 0 || cFiles.length > 0;
   },
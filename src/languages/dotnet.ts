@@ -1,3 +1,4 @@
+import { findProjectFiles } from "@/languages/project-files";
 import type { DetectOptions, LanguagePlugin } from "@/languages/types";
 import { dotnetBuildRunner } from "@/runners/dotnet-build";
 import type { LinterRunner } from "@/runners/types";
@@ -6,14 +7,10 @@ export const dotnetPlugin: LanguagePlugin = {
   id: "dotnet",
   name: ".NET",
 
-  async detect({
-    projectDir,
-    fileManager,
-    ignorePaths,
-  }: DetectOptions): Promise<boolean> {
+  async detect(opts: DetectOptions): Promise<boolean> {
     const [csprojFiles, slnFiles] = await Promise.all([
-      fileManager.glob("**/*.csproj", projectDir, ignorePaths),
-      fileManager.glob("**/*.sln", projectDir, ignorePaths),
+      findProjectFiles(opts, "**/*.csproj"),
+      findProjectFiles(opts, "**/*.sln"),
     ]);
     return csprojFiles.length > 0 || slnFiles.length > 0;
   },
@@ -1,3 +1,4 @@
+import { findProjectFiles } from "@/languages/project-files";
 import type { DetectOptions, LanguagePlugin } from "@/languages/types";
 import { seleneRunner } from "@/runners/selene";
 import type { LinterRunner } from "@/runners/types";
@@ -6,12 +7,8 @@ export const luaPlugin: LanguagePlugin = {
   id: "lua",
   name: "Lua",
 
-  async detect({
-    projectDir,
-    fileManager,
-    ignorePaths,
-  }: DetectOptions): Promise<boolean> {
-    const luaFiles = await fileManager.glob("**/*.lua", projectDir, ignorePaths);
+  async detect(opts: DetectOptions): Promise<boolean> {
+    const luaFiles = await findProjectFiles(opts, "**/*.lua");
     return luaFiles.length > 0;
   },
 
@@ -0,0 +1,43 @@
+import { Glob } from "bun";
+import type { FileManager } from "@/infra/file-manager";
+import type { DetectOptions, ProjectFileIndex } from "@/languages/types";
+
+/**
+ * Every extension a plugin probes through findProjectFiles. The index lists
+ * only these, so Bun's scanner filters the walk natively rather than handing
+ * every file in the tree (node_modules included) to JS. Add to it whenever a
+ * plugin probes a new extension, or that probe will find nothing.
+ */
+const INDEXED_FILES = "**/*.{py,ts,js,sh,bash,zsh,ksh,c,cpp,csproj,sln,lua}";
+
+/** Lazily list the non-ignored source files under `projectDir`, at most once. */
+export function createProjectFileIndex(
+  projectDir: string,
+  fileManager: FileManager,
+  ignorePaths: readonly string[]
+): ProjectFileIndex {
+  let listing: Promise<string[]> | undefined;
+  return {
+    files: () => {
+      listing ??= fileManager.glob(INDEXED_FILES, projectDir, ignorePaths);
+      return listing;
+    },
+  };
+}
+
+/**
+ * Project files matching `pattern`. Answered from the shared index when the
+ * detection pass provides one; otherwise the project is globbed directly,
+ * honouring `opts.ignorePaths`.
+ */
+export async function findProjectFiles(
+  opts: DetectOptions,
+  pattern: string
+): Promise<string[]> {
+  const { projectDir, fileManager, ignorePaths, fileIndex } = opts;
+  if (fileIndex === undefined) {
+    return fileManager.glob(pattern, projectDir, ignorePaths);
+  }
+  const matcher = new Glob(pattern);
+  return (await fileIndex.files()).filter((f) => matcher.match(f));
+}
@@ -1,3 +1,4 @@
+import { findProjectFiles } from "@/languages/project-files";
 import type { DetectOptions, LanguagePlugin } from "@/languages/types";
 import { pyrightRunner } from "@/runners/pyright";
 import { ruffRunner } from "@/runners/ruff";
@@ -7,13 +8,9 @@ export const pythonPlugin: LanguagePlugin = {
   id: "python",
   name: "Python",
 
-  async detect({
-    projectDir,
-    fileManager,
-    ignorePaths,
-  }: DetectOptions): Promise<boolean> {
-    if (await fileManager.exists(`${projectDir}/pyproject.toml`)) return true;
-    const pyFiles = await fileManager.glob("**/*.py", projectDir, ignorePaths);
+  async detect(opts: DetectOptions): Promise<boolean> {
+    if (await opts.fileManager.exists(`${opts.projectDir}/pyproject.toml`)) return true;
+    const pyFiles = await findProjectFiles(opts, "**/*.py");
     return pyFiles.length > 0;
   },
 
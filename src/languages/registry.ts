@@ -4,6 +4,7 @@ import { cppPlugin } from "@/languages/cpp";
 import { dotnetPlugin } from "@/languages/dotnet";
 import { goPlugin } from "@/languages/go";
 import { luaPlugin } from "@/languages/lua";
+import { createProjectFileIndex } from "@/languages/project-files";
 import { pythonPlugin } from "@/languages/python";
 import { rustPlugin } from "@/languages/rust";
 import { shellPlugin } from "@/languages/shell";
@@ -35,6 +36,9 @@ export async function detectLanguages(
   ignorePaths?: readonly string[]
 ): Promise<LanguagePlugin[]> {
   const mergedIgnore: readonly string[] = [...DEFAULT_IGNORE, ...(ignorePaths ?? [])];
+  // Plugins' extension probes share one walk of the project instead of each
+  // re-scanning the whole tree.
+  const fileIndex = createProjectFileIndex(projectDir, fileManager, mergedIgnore);
   const results = await Promise.all(
     ALL_PLUGINS.map(async (plugin) => ({
       plugin,
@@ -42,6 +46,7 @@ export async function detectLanguages(
         projectDir,
         fileManager,
         ignorePaths: mergedIgnore,
+        fileIndex,
       }),
     }))
   );
@@ -1,3 +1,4 @@
+import { findProjectFiles } from "@/languages/project-files";
 import type { DetectOptions, LanguagePlugin } from "@/languages/types";
 import { shellcheckRunner } from "@/runners/shellcheck";
 import { shfmtRunner } from "@/runners/shfmt";
@@ -7,16 +8,8 @@ export const shellPlugin: LanguagePlugin = {
   id: "shell",
   name: "Shell",
 
-  async detect({
-    projectDir,
-    fileManager,
-    ignorePaths,
-  }: DetectOptions): Promise<boolean> {
-    const files = await fileManager.glob(
-      "**/*.{sh,bash,zsh,ksh}",
-      projectDir,
-      ignorePaths
-    );
+  async detect(opts: DetectOptions): Promise<boolean> {
+    const files = await findProjectFiles(opts, "**/*.{sh,bash,zsh,ksh}");
     return files.length > 0;
   },
 
@@ -1,10 +1,20 @@
 import type { FileManager } from "@/infra/file-manager";
 import type { LinterRunner } from "@/runners/types";
 
+/**
+ * One listing of the project's files, shared by every plugin in a detection
+ * pass and taken with the same ignore list the pass passes as `ignorePaths`.
+ */
+export interface ProjectFileIndex {
+  /** Non-ignored source files, relative to the project dir; walked on first call. */
+  files(): Promise<readonly string[]>;
+}
+
 export interface DetectOptions {
   projectDir: string;
   fileManager: FileManager;
   ignorePaths?: readonly string[];
+  fileIndex?: ProjectFileIndex;
 }
 
 export interface LanguagePlugin {
@@ -1,3 +1,4 @@
+import { findProjectFiles } from "@/languages/project-files";
 import type { DetectOptions, LanguagePlugin } from "@/languages/types";
 import { biomeRunner } from "@/runners/biome";
 import { tscRunner } from "@/runners/tsc";
@@ -7,15 +8,11 @@ export const typescriptPlugin: LanguagePlugin = {
   id: "typescript",
   name: "TypeScript/JS",
 
-  async detect({
-    projectDir,
-    fileManager,
-    ignorePaths,
-  }: DetectOptions): Promise<boolean> {
-    if (await fileManager.exists(`${projectDir}/package.json`)) return true;
+  async detect(opts: DetectOptions): Promise<boolean> {
+    if (await opts.fileManager.exists(`${opts.projectDir}/package.json`)) return true;
     const [tsFiles, jsFiles] = await Promise.all([
-      fileManager.glob("**/*.ts", projectDir, ignorePaths),
-      fileManager.glob("**/*.js", projectDir, ignorePaths),
+      findProjectFiles(opts, "**/*.ts"),
+      findProjectFiles(opts, "**/*.js"),
     ]);
     return tsFiles.length > 0 || jsFiles.length > 0;
   },
@@ -1,5 +1,5 @@
 import { relative } from "node:path";
-import { minimatch } from "minimatch";
+import { Minimatch } from "minimatch";
 import type { ResolvedConfig } from "@/config/schema";
 import type { CommandRunner } from "@/infra/command-runner";
 import type { Console } from "@/infra/console";
@@ -55,15 +55,15 @@ export async function checkStep(
     }
 
     const allIssues = runnerResults.flat();
+    // Compile ignore globs once rather than re-parsing each pattern per issue.
+    const ignoreMatchers = config.ignorePaths.map(
+      (pattern) => new Minimatch(pattern, { dot: true })
+    );
     const filtered = allIssues.filter((issue) => {
       if (config.isAllowed(issue.rule, issue.file)) return false;
-      if (config.ignorePaths.length > 0) {
+      if (ignoreMatchers.length > 0) {
         const relPath = relative(projectDir, issue.file);
-        if (
-          config.ignorePaths.some((pattern) =>
-            minimatch(relPath, pattern, { dot: true })
-          )
-        ) {
+        if (ignoreMatchers.some((matcher) => matcher.match(relPath))) {
           return false;
         }
       }
@@ -1,14 +1,11 @@
 import type { LintIssue } from "@/models/lint-issue";
 import { ALLOW_COMMENT_RE } from "@/utils/allow-comment-re";
 
-interface AllowDirective {
-  /** 1-indexed line number of the directive itself */
-  line: number;
-  rule: string;
-}
+/** Allowed rules keyed by the 1-indexed line number of the directive itself. */
+type AllowDirectives = Map<number, Set<string>>;
 
-function parseDirectives(source: string): AllowDirective[] {
-  const directives: AllowDirective[] = [];
+function parseDirectives(source: string): AllowDirectives {
+  const directives: AllowDirectives = new Map();
   const lines = source.split("\n");
   for (let i = 0; i < lines.length; i++) {
     const line = lines[i];
@@ -17,16 +14,23 @@ function parseDirectives(source: string): AllowDirective[] {
     if (match !== null) {
       const rule = match[1];
       if (rule !== undefined) {
-        directives.push({ line: i + 1, rule });
+        const existing = directives.get(i + 1);
+        if (existing !== undefined) {
+          existing.add(rule);
+        } else {
+          directives.set(i + 1, new Set([rule]));
+        }
       }
     }
   }
   return directives;
 }
 
-function isSuppressed(issue: LintIssue, directives: AllowDirective[]): boolean {
-  return directives.some(
-    (d) => d.rule === issue.rule && (d.line === issue.line || d.line + 1 === issue.line)
+/** A directive covers its own line and the line immediately after it. */
+function isSuppressed(issue: LintIssue, directives: AllowDirectives): boolean {
+  return (
+    directives.get(issue.line)?.has(issue.rule) === true ||
+    directives.get(issue.line - 1)?.has(issue.rule) === true
   );
 }
 
@@ -62,7 +66,7 @@ export async function filterAllowComments(
       }
 
       const directives = parseDirectives(source);
-      if (directives.length === 0) return;
+      if (directives.size === 0) return;
 
       for (const idx of indices) {
         const issue = issues[idx];
@@ -36,15 +36,18 @@ export async function statusStep(
       fileManager
     );
 
-    const filtered = allIssues.filter(
-      (issue) => !config.isAllowed(issue.rule, issue.file)
-    );
-
-    const newIssues = filtered.filter(
-      (issue) => classifyFingerprint(issue.fingerprint, baselineMap) === "new"
-    );
+    // Single pass: allow-filtering, baseline classification and fingerprint
+    // collection all touch each issue once instead of three separate sweeps.
+    const newIssues: LintIssue[] = [];
+    const currentFingerprints = new Set<string>();
+    for (const issue of allIssues) {
+      if (config.isAllowed(issue.rule, issue.file)) continue;
+      currentFingerprints.add(issue.fingerprint);
+      if (classifyFingerprint(issue.fingerprint, baselineMap) === "new") {
+        newIssues.push(issue);
+      }
+    }
 
-    const currentFingerprints = new Set(filtered.map((i) => i.fingerprint));
     let fixedCount = 0;
     for (const fp of baselineMap.keys()) {
       if (!currentFingerprints.has(fp)) fixedCount++;
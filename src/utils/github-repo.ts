@@ -6,8 +6,9 @@ export interface GitHubRepoInfo {
   readonly authenticated: boolean;
 }
 
-const SSH_PATTERN = /git@github\.com:([^/]+)\/([^/.]+)/;
-const HTTPS_PATTERN = /github\.com\/([^/]+)\/([^/.]+)/;
+// SSH (`git@github.com:owner/repo`) and HTTPS (`github.com/owner/repo`) remotes
+// in one pattern, so a remote URL is scanned once.
+const REMOTE_PATTERN = /(?:git@github\.com:|github\.com\/)([^/]+)\/([^/.]+)/;
 
 /** Detect GitHub repo from git remote and gh auth status. */
 export async function detectGitHubRepo(
@@ -20,13 +21,15 @@ export async function detectGitHubRepo(
   if (remoteResult.exitCode !== 0) return undefined;
 
   const url = remoteResult.stdout.trim();
-  const match = SSH_PATTERN.exec(url) ?? HTTPS_PATTERN.exec(url);
+  const match = REMOTE_PATTERN.exec(url);
   if (match === null) return undefined;
 
   const owner = match[1];
   const repo = match[2];
   if (owner === undefined || repo === undefined) return undefined;
 
+  // Only probe gh once the remote is confirmed to be GitHub: `gh auth status`
+  // verifies the token over the network when logged in.
   const authResult = await commandRunner.run(["gh", "auth", "status"], {
     cwd: projectDir,
   });
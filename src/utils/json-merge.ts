@@ -32,9 +32,53 @@ export function mergeWithoutOverwrite(
 /**
  * Strip single-line (//) and multi-line (/* *\/) comments from a JSON string.
  * Enables parsing JSONC files (e.g. VS Code's settings.json, extensions.json).
+ *
+ * Single forward scan: string literals are copied verbatim, so a `//` inside a
+ * value (e.g. a `$schema` URL) is never mistaken for a comment, and the text
+ * between comments is copied in slices rather than char by char.
  */
 function stripJsonComments(text: string): string {
-  return text.replace(/\/\/.*$/gm, "").replace(/\/\*[\s\S]*?\*\//g, "");
+  let out = "";
+  let segmentStart = 0;
+  let i = 0;
+  while (i < text.length) {
+    const ch = text[i];
+    if (ch === '"') {
+      i = skipJsonString(text, i);
+      continue;
+    }
+    if (ch === "/" && text[i + 1] === "/") {
+      out += text.slice(segmentStart, i);
+      const newline = text.indexOf("\n", i + 2);
+      i = newline === -1 ? text.length : newline;
+      segmentStart = i;
+      continue;
+    }
+    if (ch === "/" && text[i + 1] === "*") {
+      out += text.slice(segmentStart, i);
+      const close = text.indexOf("*/", i + 2);
+      i = close === -1 ? text.length : close + 2;
+      segmentStart = i;
+      continue;
+    }
+    i++;
+  }
+  return out + text.slice(segmentStart);
+}
+
+/** Return the index just past the closing quote of the string starting at `start`. */
+function skipJsonString(text: string, start: number): number {
+  let i = start + 1;
+  while (i < text.length) {
+    const ch = text[i];
+    if (ch === "\\") {
+      i += 2;
+      continue;
+    }
+    if (ch === '"') return i + 1;
+    i++;
+  }
+  return i;
 }
 
 /**
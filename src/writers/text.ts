@@ -1,5 +1,11 @@
 import type { LintIssue } from "@/models/lint-issue";
 
+/** Upper-cased severity labels, resolved once instead of per formatted issue. */
+const SEVERITY_LABELS: Readonly<Record<LintIssue["severity"], string>> = {
+  error: "ERROR",
+  warning: "WARNING",
+};
+
 /**
  * Format a list of lint issues as human-readable text.
  * Returns an empty string if there are no issues.
@@ -9,9 +15,7 @@ export function formatIssues(issues: LintIssue[]): string {
 
   const lines: string[] = [];
   for (const issue of issues) {
-    const location = `${issue.file}:${issue.line}:${issue.col}`;
-    const severity = issue.severity.toUpperCase();
-    lines.push(`${location}: [${severity}] ${issue.rule}: ${issue.message}`);
+    lines.push(formatIssue(issue));
   }
   lines.push("");
   lines.push(`${issues.length} issue(s) found`);
@@ -23,6 +27,6 @@ export function formatIssues(issues: LintIssue[]): string {
  */
 export function formatIssue(issue: LintIssue): string {
   const location = `${issue.file}:${issue.line}:${issue.col}`;
-  const severity = issue.severity.toUpperCase();
+  const severity = SEVERITY_LABELS[issue.severity];
   return `${location}: [${severity}] ${issue.rule}: ${issue.message}`;
 }
@@ -0,0 +1,44 @@
+import type { FileManager } from "@/infra/file-manager";
+
+/** Delegates to another FileManager, counting glob calls (project walks). */
+export class CountingFileManager implements FileManager {
+  private readonly inner: FileManager;
+  globCalls = 0;
+
+  constructor(inner: FileManager) {
+    this.inner = inner;
+  }
+
+  readText(path: string): Promise<string> {
+    return this.inner.readText(path);
+  }
+
+  writeText(path: string, content: string): Promise<void> {
+    return this.inner.writeText(path, content);
+  }
+
+  appendText(path: string, content: string): Promise<void> {
+    return this.inner.appendText(path, content);
+  }
+
+  exists(path: string): Promise<boolean> {
+    return this.inner.exists(path);
+  }
+
+  mkdir(path: string, opts?: { parents?: boolean }): Promise<void> {
+    return this.inner.mkdir(path, opts);
+  }
+
+  glob(pattern: string, cwd: string, ignore?: readonly string[]): Promise<string[]> {
+    this.globCalls++;
+    return this.inner.glob(pattern, cwd, ignore);
+  }
+
+  isSymlink(path: string): Promise<boolean> {
+    return this.inner.isSymlink(path);
+  }
+
+  delete(path: string): Promise<void> {
+    return this.inner.delete(path);
+  }
+}
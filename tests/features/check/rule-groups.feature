@@ -96,6 +96,7 @@ Feature: Rule groups structure and toggling
     Given a ruleset built with all groups disabled
     Then the command rule count should be 1
     And the first command rule should be a recurse rule
+    And inline scripts should be re-checked
 
   Scenario: Unknown group names do not break buildRuleSet
     Given a ruleset built with disabledGroups "nonexistent"
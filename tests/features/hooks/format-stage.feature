@@ -27,5 +27,5 @@ Feature: Format stage configuration
     When I call getStagedFiles
     Then no file in the result should be an empty string
 
-  Scenario: FORMATTERS cmd entries return non-empty arrays for tryRun
+  Scenario: FORMATTERS cmd entries return non-empty arrays for tryRunAsync
     Then each formatter cmd should return a non-empty array with a truthy first element
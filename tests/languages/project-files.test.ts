@@ -0,0 +1,79 @@
+import { describe, expect, test } from "bun:test";
+import { luaPlugin } from "@/languages/lua";
+import { createProjectFileIndex, findProjectFiles } from "@/languages/project-files";
+import { CountingFileManager } from "../fakes/counting-file-manager";
+import { FakeFileManager } from "../fakes/fake-file-manager";
+
+const IGNORE: readonly string[] = ["node_modules/**"];
+
+function seeded(): CountingFileManager {
+  const inner = new FakeFileManager();
+  inner.seed("/project/src/app.lua", "");
+  inner.seed("/project/vendor/lib.lua", "");
+  inner.seed("/project/node_modules/pkg/init.lua", "");
+  inner.seed("/project/src/main.py", "");
+  inner.seed("/project/README.md", "");
+  return new CountingFileManager(inner);
+}
+
+describe("findProjectFiles", () => {
+  test("answers every pattern from a single walk", async () => {
+    const fm = seeded();
+    const fileIndex = createProjectFileIndex("/project", fm, IGNORE);
+    const opts = {
+      projectDir: "/project",
+      fileManager: fm,
+      ignorePaths: IGNORE,
+      fileIndex,
+    };
+
+    const lua = await findProjectFiles(opts, "**/*.lua");
+    const py = await findProjectFiles(opts, "**/*.py");
+
+    expect(lua.sort()).toEqual(["src/app.lua", "vendor/lib.lua"]);
+    expect(py).toEqual(["src/main.py"]);
+    expect(fm.globCalls).toBe(1);
+  });
+
+  test("indexes only files with a probed extension", async () => {
+    const fm = seeded();
+    const fileIndex = createProjectFileIndex("/project", fm, IGNORE);
+
+    const files = await fileIndex.files();
+
+    expect(files).toContain("src/main.py");
+    expect(files).not.toContain("README.md");
+    expect(files).not.toContain("node_modules/pkg/init.lua");
+  });
+
+  test("lets a plugin probe through the shared index", async () => {
+    const fm = seeded();
+    const fileIndex = createProjectFileIndex("/project", fm, IGNORE);
+
+    const active = await luaPlugin.detect({
+      projectDir: "/project",
+      fileManager: fm,
+      ignorePaths: IGNORE,
+      fileIndex,
+    });
+
+    expect(active).toBe(true);
+    expect(fm.globCalls).toBe(1);
+  });
+
+  test("globs directly, honouring ignorePaths, without an index", async () => {
+    const fm = seeded();
+
+    const lua = await findProjectFiles(
+      {
+        projectDir: "/project",
+        fileManager: fm,
+        ignorePaths: [...IGNORE, "vendor/**"],
+      },
+      "**/*.lua"
+    );
+
+    expect(lua).toEqual(["src/app.lua"]);
+    expect(fm.globCalls).toBe(1);
+  });
+});
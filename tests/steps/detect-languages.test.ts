@@ -1,6 +1,7 @@
 import { describe, expect, test } from "bun:test";
 import type { FileManager } from "@/infra/file-manager";
 import { detectLanguagesStep } from "@/steps/detect-languages";
+import { CountingFileManager } from "../fakes/counting-file-manager";
 import { FakeFileManager } from "../fakes/fake-file-manager";
 
 describe("detectLanguagesStep", () => {
@@ -62,6 +63,23 @@ describe("detectLanguagesStep", () => {
     expect(withIgnoreIds).not.toContain("python");
   });
 
+  test("walks the project once for all plugins' glob probes", async () => {
+    const innerFm = new FakeFileManager();
+    innerFm.seed("/project/src/app.lua", "");
+    innerFm.seed("/project/scripts/build.sh", "");
+    innerFm.seed("/project/src/main.c", "");
+    const countingFm = new CountingFileManager(innerFm);
+
+    const { languages } = await detectLanguagesStep("/project", countingFm);
+
+    const ids = languages.map((p) => p.id);
+    expect(ids).toContain("lua");
+    expect(ids).toContain("shell");
+    expect(ids).toContain("cpp");
+    expect(ids).not.toContain("python");
+    expect(countingFm.globCalls).toBe(1);
+  });
+
   test("returns error status on exception from fileManager", async () => {
     const innerFm = new FakeFileManager();
     // Make glob throw to trigger the catch path
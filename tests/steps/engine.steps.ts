@@ -335,6 +335,10 @@ Then<EngineWorld>(
   }
 );
 
+Then<EngineWorld>("inline scripts should be re-checked", (world: EngineWorld) => {
+  expect(world.ruleset.recurseInline).toBe(true);
+});
+
 Then<EngineWorld>(
   "the path rules should match {string} for write",
   (world: EngineWorld, file: unknown) => {
@@ -52,6 +52,7 @@ describe("detectGitHubRepo", () => {
     const result = await detectGitHubRepo(runner, PROJECT_DIR);
 
     expect(result).toBeUndefined();
+    expect(runner.calls.some((args) => args[0] === "gh")).toBe(false);
   });
 
   test("returns undefined when git remote fails", async () => {
@@ -65,6 +66,7 @@ describe("detectGitHubRepo", () => {
     const result = await detectGitHubRepo(runner, PROJECT_DIR);
 
     expect(result).toBeUndefined();
+    expect(runner.calls.some((args) => args[0] === "gh")).toBe(false);
   });
 
   test("authenticated=false when gh auth fails", async () => {
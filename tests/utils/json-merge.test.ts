@@ -0,0 +1,42 @@
+import { describe, expect, test } from "bun:test";
+import { readJsonObject } from "@/utils/json-merge";
+import { FakeFileManager } from "../fakes/fake-file-manager";
+
+const PATH = "/project/.vscode/settings.json";
+
+describe("readJsonObject", () => {
+  test("returns empty object when the file does not exist", async () => {
+    const fm = new FakeFileManager();
+    expect(await readJsonObject(PATH, fm)).toEqual({});
+  });
+
+  test("strips line and block comments", async () => {
+    const fm = new FakeFileManager();
+    fm.seed(PATH, '{\n  // line\n  "a": 1, /* block */ "b": 2\n}');
+    expect(await readJsonObject(PATH, fm)).toEqual({ a: 1, b: 2 });
+  });
+
+  test("keeps comment markers inside string values", async () => {
+    const fm = new FakeFileManager();
+    fm.seed(
+      PATH,
+      '{\n  "$schema": "https://example.com/schema.json", // trailing\n  "glob": "/*.ts"\n}'
+    );
+    expect(await readJsonObject(PATH, fm)).toEqual({
+      $schema: "https://example.com/schema.json",
+      glob: "/*.ts",
+    });
+  });
+
+  test("handles escaped quotes inside string values", async () => {
+    const fm = new FakeFileManager();
+    fm.seed(PATH, '{"msg": "say \\"//hi\\"" /* c */}');
+    expect(await readJsonObject(PATH, fm)).toEqual({ msg: 'say "//hi"' });
+  });
+
+  test("returns undefined for a non-object document", async () => {
+    const fm = new FakeFileManager();
+    fm.seed(PATH, "[1, 2]");
+    expect(await readJsonObject(PATH, fm)).toBeUndefined();
+  });
+});